@@ -1,6 +1,13 @@
 """Test random text output"""
+import re
 import requests
 
+# One keep-alive connection for every test case instead of a new socket per POST
+SESSION = requests.Session()
+
+# HTML markup used in the meaning field, stripped in a single pass
+MEANING_TAGS = re.compile(r'</?strong>|<br>')
+
 print("Testing Random Text Output")
 print("=" * 80)
 
@@ -37,9 +44,9 @@ for i, test in enumerate(test_cases, 1):
     print()
     
     try:
-        r = requests.post('http://localhost:5000/analyze', 
-                         json={'text': test['text']}, 
-                         timeout=10)
+        r = SESSION.post('http://localhost:5000/analyze', 
+                        json={'text': test['text']}, 
+                        timeout=10)
         
         if r.status_code == 200:
             data = r.json()['data']
@@ -53,7 +60,7 @@ for i, test in enumerate(test_cases, 1):
                 print(f"\n  📝 Meaning (பொருள்) shown to user:")
                 meaning = data.get('meaning', '')
                 # Clean HTML tags
-                clean_meaning = meaning.replace('<strong>', '').replace('</strong>', '').replace('<br>', '\n')
+                clean_meaning = MEANING_TAGS.sub(lambda m: '\n' if m.group() == '<br>' else '', meaning)
                 print(f"  {clean_meaning}")
             else:
                 print(f"\n  ⚠️  Detected as: {data['source']}")